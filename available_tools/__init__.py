@@ -1,103 +1,231 @@
-from typing import Dict, Callable, Coroutine, Any, List, Optional
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Callable, Coroutine, Any, List, NamedTuple, Optional
 
 from toolkit.mcp_server.models import ToolDefinition
-from .tavily_search.tavily_search_tool import get_tavily_search_tool_definition, execute_tavily_search, initialize_tavily_search_tool
-from .google_sheets.google_sheets_tool import (
-    get_google_sheets_append_tool_definition,
-    execute_google_sheets_append,
-    get_google_sheets_read_tool_definition,
-    execute_google_sheets_read,
-    get_google_sheets_update_tool_definition,
-    execute_google_sheets_update,
-    initialize_google_sheets_tool
-)
 
-# Dictionary to hold tool definitions
-TOOL_DEFINITIONS: Dict[str, ToolDefinition] = {}
 
-# Dictionary to hold tool execution functions
-TOOL_EXECUTORS: Dict[str, Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]]] = {}
+class _ToolSpec(NamedTuple):
+    """Describes where a tool's entry points live, without importing them."""
+    module_path: str
+    definition_getter: str
+    executor: str
+    initializer: Optional[str] = None
+    is_initializer_shared: bool = False
+
+
+# Registry of tool specs. The backing modules (and their SDKs — tavily,
+# googleapiclient, etc.) are imported only when a definition, executor, or
+# initializer is first needed, keeping import of this package cheap.
+_TOOL_SPECS: Dict[str, _ToolSpec] = {}
+
+# Lazy caches behind the public TOOL_DEFINITIONS / TOOL_EXECUTORS /
+# TOOL_INITIALIZERS module attributes (resolved via PEP 562 __getattr__ below)
+_tool_definitions: Dict[str, ToolDefinition] = {}
+_tool_executors: Dict[str, Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]]] = {}
+# A dict rather than a list/set: O(1) dedupe of shared initializers while
+# preserving registration order
+_tool_initializers: Dict[Callable[[], None], None] = {}
+
+
+def _load_tool_module(spec: _ToolSpec):
+    return importlib.import_module(spec.module_path, package=__name__)
+
+
+def _get_definition(tool_name: str) -> ToolDefinition:
+    """Returns the (cached) ToolDefinition for a tool, importing its module on first use."""
+    definition = _tool_definitions.get(tool_name)
+    if definition is None:
+        spec = _TOOL_SPECS[tool_name]
+        definition = getattr(_load_tool_module(spec), spec.definition_getter)()
+        if tool_name != definition.tool_name:
+            raise ValueError(f"Tool name mismatch for {tool_name}: definition has {definition.tool_name}")
+        _tool_definitions[tool_name] = definition
+    return definition
+
+
+def _make_executor_shim(tool_name: str) -> Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]]:
+    """Builds an async shim that resolves (and caches) the real executor lazily."""
+    spec = _TOOL_SPECS[tool_name]
+    real_executor: Optional[Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]]] = None
+
+    async def _execute(inputs: Dict[str, Any]) -> Dict[str, Any]:
+        nonlocal real_executor
+        if real_executor is None:
+            real_executor = getattr(_load_tool_module(spec), spec.executor)
+        return await real_executor(inputs)
+
+    _execute.__name__ = spec.executor
+    return _execute
+
+
+def _get_executor(tool_name: str) -> Optional[Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]]]:
+    """Returns the (cached) executor shim for a tool, building it on first use."""
+    executor = _tool_executors.get(tool_name)
+    if executor is None and tool_name in _TOOL_SPECS:
+        executor = _make_executor_shim(tool_name)
+        _tool_executors[tool_name] = executor
+    return executor
 
-# List of initialization functions for all tools
-TOOL_INITIALIZERS: List[Callable[[], None]] = []
 
 def register_tool(
     tool_name: str,
-    definition_getter: Callable[[], ToolDefinition],
-    executor: Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]],
-    initializer: Optional[Callable[[], None]] = None,
+    module_path: str,
+    definition_getter: str,
+    executor: str,
+    initializer: Optional[str] = None,
     is_initializer_shared: bool = False
 ):
-    """Registers a tool's definition, executor, and optional initializer."""
-    definition = definition_getter()
-    if tool_name != definition.tool_name:
-        raise ValueError(f"Tool name mismatch for {tool_name}: definition has {definition.tool_name}")
-    
-    TOOL_DEFINITIONS[tool_name] = definition
-    TOOL_EXECUTORS[tool_name] = executor
-    if initializer and (not is_initializer_shared or initializer not in TOOL_INITIALIZERS):
-        TOOL_INITIALIZERS.append(initializer)
+    """Registers a tool by name, deferring all imports until the tool is used."""
+    _TOOL_SPECS[tool_name] = _ToolSpec(
+        module_path=module_path,
+        definition_getter=definition_getter,
+        executor=executor,
+        initializer=initializer,
+        is_initializer_shared=is_initializer_shared
+    )
+    # Drop any stale caches if a tool is re-registered
+    _tool_definitions.pop(tool_name, None)
+    _tool_executors.pop(tool_name, None)
+
 
 # Register Tavily Search tool
 register_tool(
     tool_name="tavily_search",
-    definition_getter=get_tavily_search_tool_definition,
-    executor=execute_tavily_search,
-    initializer=initialize_tavily_search_tool
+    module_path=".tavily_search.tavily_search_tool",
+    definition_getter="get_tavily_search_tool_definition",
+    executor="execute_tavily_search",
+    initializer="initialize_tavily_search_tool"
 )
 
 # Register Google Sheets Append tool
 register_tool(
     tool_name="google_sheets_append",
-    definition_getter=get_google_sheets_append_tool_definition,
-    executor=execute_google_sheets_append,
-    initializer=initialize_google_sheets_tool,
+    module_path=".google_sheets.google_sheets_tool",
+    definition_getter="get_google_sheets_append_tool_definition",
+    executor="execute_google_sheets_append",
+    initializer="initialize_google_sheets_tool",
     is_initializer_shared=True
 )
 
 # Register Google Sheets Read tool
 register_tool(
     tool_name="google_sheets_read",
-    definition_getter=get_google_sheets_read_tool_definition,
-    executor=execute_google_sheets_read,
-    initializer=initialize_google_sheets_tool,
+    module_path=".google_sheets.google_sheets_tool",
+    definition_getter="get_google_sheets_read_tool_definition",
+    executor="execute_google_sheets_read",
+    initializer="initialize_google_sheets_tool",
     is_initializer_shared=True
 )
 
 # Register Google Sheets Update tool
 register_tool(
     tool_name="google_sheets_update",
-    definition_getter=get_google_sheets_update_tool_definition,
-    executor=execute_google_sheets_update,
-    initializer=initialize_google_sheets_tool,
+    module_path=".google_sheets.google_sheets_tool",
+    definition_getter="get_google_sheets_update_tool_definition",
+    executor="execute_google_sheets_update",
+    initializer="initialize_google_sheets_tool",
+    is_initializer_shared=True
+)
+
+# Register Google Sheets Batch Read tool
+register_tool(
+    tool_name="google_sheets_batch_read",
+    module_path=".google_sheets.google_sheets_tool",
+    definition_getter="get_google_sheets_batch_read_tool_definition",
+    executor="execute_google_sheets_batch_read",
+    initializer="initialize_google_sheets_tool",
     is_initializer_shared=True
 )
 
+# Register Google Sheets Batch Update tool
+register_tool(
+    tool_name="google_sheets_batch_update",
+    module_path=".google_sheets.google_sheets_tool",
+    definition_getter="get_google_sheets_batch_update_tool_definition",
+    executor="execute_google_sheets_batch_update",
+    initializer="initialize_google_sheets_tool",
+    is_initializer_shared=True
+)
+
+
 def get_all_tool_definitions() -> List[ToolDefinition]:
-    """Returns a list of all registered tool definitions."""
-    return list(TOOL_DEFINITIONS.values())
+    """Returns a list of all registered tool definitions, resolving them on demand."""
+    return [_get_definition(tool_name) for tool_name in _TOOL_SPECS]
+
 
 def get_tool_executor(tool_name: str) -> Optional[Callable[[Dict[str, Any]], Coroutine[Any, Any, Dict[str, Any]]]]:
     """Returns the executor for a given tool name."""
-    return TOOL_EXECUTORS.get(tool_name)
+    return _get_executor(tool_name)
+
+
+def _resolve_initializers() -> Dict[Callable[[], None], None]:
+    """Imports and caches each tool's initializer, deduplicating shared ones."""
+    for tool_name, spec in _TOOL_SPECS.items():
+        if not spec.initializer:
+            continue
+        _tool_initializers.setdefault(getattr(_load_tool_module(spec), spec.initializer), None)
+    return _tool_initializers
+
+
+def get_all_tool_initializers() -> List[Callable[[], None]]:
+    """Returns the deduplicated initializers of all registered tools.
+
+    Exposed so async callers can schedule them concurrently themselves
+    (e.g. via asyncio.to_thread + gather) instead of blocking on
+    initialize_all_tools.
+    """
+    return list(_resolve_initializers())
+
 
 def initialize_all_tools():
-    """Initializes all registered tools."""
-    unique_initializers = []
-    for init_func in TOOL_INITIALIZERS:
-        if init_func not in unique_initializers:
-            unique_initializers.append(init_func)
-    
-    for initializer in unique_initializers:
+    """Initializes all registered tools, running their initializers concurrently.
+
+    Initializers are sync and I/O-bound (credential lookups, client
+    construction), so a small thread pool turns cold-start cost from the sum
+    of their latencies into roughly the slowest one. Failures are logged and
+    do not block the other tools.
+    """
+    initializers = get_all_tool_initializers()
+    if not initializers:
+        return
+
+    def _run(initializer: Callable[[], None]) -> None:
         try:
             initializer()
         except Exception as e:
             print(f"Error during tool initialization: {initializer.__name__} failed with {e}")
 
+    with ThreadPoolExecutor(max_workers=len(initializers)) as executor:
+        list(executor.map(_run, initializers))
+
+
+def __getattr__(name: str):
+    """PEP 562 hook resolving the public registry dicts on first attribute access.
+
+    Keeps `import toolkit.available_tools` free of per-tool work: the caches
+    are only filled when TOOL_DEFINITIONS / TOOL_EXECUTORS / TOOL_INITIALIZERS
+    are actually read.
+    """
+    if name == "TOOL_DEFINITIONS":
+        for tool_name in _TOOL_SPECS:
+            _get_definition(tool_name)
+        return _tool_definitions
+    if name == "TOOL_EXECUTORS":
+        for tool_name in _TOOL_SPECS:
+            _get_executor(tool_name)
+        return _tool_executors
+    if name == "TOOL_INITIALIZERS":
+        return _resolve_initializers()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "get_all_tool_definitions",
+    "get_all_tool_initializers",
     "get_tool_executor",
     "initialize_all_tools",
+    "register_tool",
     "TOOL_DEFINITIONS",
     "TOOL_EXECUTORS"
-] 
\ No newline at end of file
+]
@@ -45,4 +45,34 @@ class UpdateResponse(BaseModel):
     updated_range: str = Field(..., description="The A1 notation of the range that was updated.")
     updated_rows: int = Field(..., description="The number of rows updated.")
     updated_columns: int = Field(..., description="The number of columns updated.")
-    updated_cells: int = Field(..., description="The total number of cells updated.") 
\ No newline at end of file
+    updated_cells: int = Field(..., description="The total number of cells updated.")
+
+
+class BatchReadRequest(BaseModel):
+    spreadsheet_id: str = Field(..., description="The ID of the spreadsheet.")
+    ranges: List[str] = Field(..., description="The A1 notations of the ranges to read, fetched in a single API call.")
+    major_dimension: Optional[str] = Field(None, description="The major dimension that results should use. ROWS or COLUMNS.")
+    value_render_option: Optional[str] = Field(None, description="How values should be represented in the output. FORMATTED_VALUE, UNFORMATTED_VALUE, FORMULA.")
+    date_time_render_option: Optional[str] = Field(None, description="How dates, times, and durations should be represented. SERIAL_NUMBER or FORMATTED_STRING.")
+
+
+class BatchReadResponse(BaseModel):
+    spreadsheet_id: str = Field(..., description="The ID of the spreadsheet.")
+    value_ranges: Optional[List[dict]] = Field(None, description="One ValueRange (range, majorDimension, values) per requested range.")
+
+
+class BatchUpdateData(BaseModel):
+    range: str = Field(..., description="The A1 notation of the range to write.")
+    values: List[List[Any]] = Field(..., description="The data to write to this range. A list of rows, where each row is a list of cell values.")
+
+
+class BatchUpdateRequest(BaseModel):
+    spreadsheet_id: str = Field(..., description="The ID of the spreadsheet.")
+    data: List[BatchUpdateData] = Field(..., description="The range/values pairs to write, applied in a single API call.")
+    value_input_option: Optional[str] = Field("USER_ENTERED", description="How the input data should be interpreted. RAW or USER_ENTERED.")
+
+
+class BatchUpdateResponse(BaseModel):
+    spreadsheet_id: str = Field(..., description="The ID of the spreadsheet.")
+    total_updated_cells: Optional[int] = Field(None, description="The total number of cells updated across all ranges.")
+    responses: Optional[List[dict]] = Field(None, description="One UpdateValuesResponse per written range.") 
\ No newline at end of file
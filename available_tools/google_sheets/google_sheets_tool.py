@@ -1,43 +1,163 @@
+import asyncio
+import gzip
 import os
 import logging
-from typing import Dict, Any, Optional, List
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
+from urllib.parse import quote
 
-import google.auth
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import httpx
+import orjson
 
 from toolkit.mcp_server.models import ToolDefinition, ToolInputSchema, ToolOutputSchemaDefinition
-from .google_sheets_models import AppendRequest, AppendResponse, ReadRequest, ReadResponse, UpdateRequest, UpdateResponse
+from .google_sheets_models import (
+    AppendRequest, AppendResponse,
+    ReadRequest, ReadResponse,
+    UpdateRequest, UpdateResponse,
+    BatchReadRequest, BatchReadResponse,
+    BatchUpdateRequest, BatchUpdateResponse
+)
 
 logger = logging.getLogger(__name__)
 
-# Global Google Sheets service client instance
-google_sheets_service: Optional[Any] = None
+SHEETS_API_BASE_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+SHEETS_SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+
+# Cell values treated as empty when checking read results for meaningful data
+_EMPTY_CELLS = frozenset((None, "", " "))
+
+# Lazily built (credentials, http client) pair. Executors capture both with a
+# single lookup per request instead of re-reading and None-checking two
+# module globals on every call.
+_sheets_state: Optional[Tuple[Any, httpx.AsyncClient]] = None
+
+# Guards lazy client construction under concurrent executor calls
+_sheets_init_lock = asyncio.Lock()
 
 def initialize_google_sheets_tool():
-    """Initializes the Google Sheets API client if not already initialized."""
-    global google_sheets_service
-    if google_sheets_service:
+    """Initializes Google credentials and the pooled Sheets HTTP client."""
+    global _sheets_state
+    if _sheets_state is not None:
         return
 
     try:
-        creds, _ = google.auth.default(scopes=['https://www.googleapis.com/auth/spreadsheets'])
-        google_sheets_service = build("sheets", "v4", credentials=creds)
-        logger.info("Google Sheets client initialized successfully.")
+        # Imported here rather than at module top: google.auth drags in a
+        # heavy dependency chain that Tavily-only processes should never pay for
+        import google.auth
+
+        credentials, _ = google.auth.default(scopes=SHEETS_SCOPES)
+        # One keep-alive pool shared by all Sheets executors: TCP + TLS stay
+        # warm across calls instead of a handshake per request
+        client = httpx.AsyncClient(
+            base_url=SHEETS_API_BASE_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20)
+        )
+        _sheets_state = (credentials, client)
+        logger.info("Google Sheets HTTP client initialized successfully.")
     except Exception as e:
-        logger.error(f"Failed to initialize Google Sheets client: {e}", exc_info=True)
-        google_sheets_service = None
+        # %s-style args are only rendered if a handler accepts the record
+        logger.error("Failed to initialize Google Sheets client: %s", e, exc_info=True)
+        _sheets_state = None
+
+async def _get_sheets_state() -> Optional[Tuple[Any, httpx.AsyncClient]]:
+    """Returns (credentials, http client), building them exactly once under concurrency.
+
+    Double-checked locking: the unlocked check keeps the warm path free of
+    lock overhead, and the re-check under the lock ensures only one caller
+    pays the credential lookup on cold start.
+    """
+    if _sheets_state is None:
+        async with _sheets_init_lock:
+            if _sheets_state is None:
+                await asyncio.to_thread(initialize_google_sheets_tool)
+    return _sheets_state
+
+# Cached bearer token and its monotonic deadline. The deadline sits 60 s
+# before the real expiry so a token never runs out mid-request; until then
+# the hot path skips google.auth's per-call expiry bookkeeping entirely.
+_token_cache: Optional[Tuple[str, float]] = None
+_TOKEN_REFRESH_MARGIN_SECONDS = 60.0
+_token_refresh_lock = asyncio.Lock()
+
+async def _get_access_token(creds: Any) -> str:
+    """Returns a cached OAuth bearer token, refreshing it shortly before expiry."""
+    global _token_cache
+    cached = _token_cache
+    if cached is not None and time.monotonic() < cached[1]:
+        return cached[0]
+
+    async with _token_refresh_lock:
+        cached = _token_cache
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
+
+        import google.auth.transport.requests
+
+        # Token refresh is blocking I/O (metadata server / token endpoint)
+        await asyncio.to_thread(creds.refresh, google.auth.transport.requests.Request())
+        # creds.expiry is a naive UTC datetime; translate the remaining
+        # lifetime onto the monotonic clock (fall back to the usual 3600 s)
+        if creds.expiry is not None:
+            lifetime = (creds.expiry - datetime.utcnow()).total_seconds()
+        else:
+            lifetime = 3600.0
+        _token_cache = (creds.token, time.monotonic() + lifetime - _TOKEN_REFRESH_MARGIN_SECONDS)
+        return creds.token
+
+async def _auth_headers(creds: Any) -> Dict[str, str]:
+    """Returns Authorization headers with a valid OAuth bearer token."""
+    return {"Authorization": f"Bearer {await _get_access_token(creds)}"}
+
+def _values_url(spreadsheet_id: str, range_: str, suffix: str = "") -> str:
+    """Builds a /values/ path, percent-encoding the A1 range."""
+    return f"/{spreadsheet_id}/values/{quote(range_, safe='')}{suffix}"
+
+# Request bodies at or above this size are gzip-compressed before upload;
+# smaller payloads aren't worth the compression CPU
+_GZIP_MIN_BYTES = 8192
+
+def _encode_json_body(body: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+    """Serializes a request body with orjson, gzip-compressing large payloads.
+
+    Spreadsheet rows are highly redundant JSON, so compression typically
+    shrinks big append/update uploads 5-10x on top of orjson's faster
+    serialization of nested list-of-list values.
+    """
+    data = orjson.dumps(body)
+    headers = {"Content-Type": "application/json"}
+    if len(data) >= _GZIP_MIN_BYTES:
+        data = gzip.compress(data, compresslevel=5)
+        headers["Content-Encoding"] = "gzip"
+    return data, headers
+
+def _http_error_message(operation: str, error: httpx.HTTPStatusError) -> str:
+    response = error.response
+    details = response.text if response.content else "N/A"
+    return f"API error ({operation}): {response.status_code} - {response.reason_phrase}. Details: {details}"
+
+# Input schema fragments shared by the Sheets tool definitions; definitions
+# are immutable once built, so the same instances are safe to reference from
+# several tools
+_SPREADSHEET_ID_INPUT = ToolInputSchema(name="spreadsheet_id", description="The ID of the spreadsheet.", type="string", required=True)
+_VALUE_INPUT_OPTION_INPUT = ToolInputSchema(name="value_input_option", description="How input data is interpreted. Options: 'RAW', 'USER_ENTERED'. Default: 'USER_ENTERED'.", type="string", required=False)
+_MAJOR_DIMENSION_INPUT = ToolInputSchema(name="major_dimension", description="ROWS or COLUMNS for result. Default: ROWS.", type="string", required=False)
+_VALUE_RENDER_OPTION_INPUT = ToolInputSchema(name="value_render_option", description="How values are rendered (e.g., FORMATTED_VALUE). Default: FORMATTED_VALUE", type="string", required=False)
+_DATE_TIME_RENDER_OPTION_INPUT = ToolInputSchema(name="date_time_render_option", description="How date/time is rendered (e.g., SERIAL_NUMBER). Default: SERIAL_NUMBER", type="string", required=False)
 
 # --- Append Tool --- #
+@lru_cache(maxsize=1)
 def get_google_sheets_append_tool_definition() -> ToolDefinition:
     return ToolDefinition(
         tool_name="google_sheets_append",
         description="Appends values to a Google Sheet. Finds a table in the specified range and appends data after the last row.",
         inputs=[
-            ToolInputSchema(name="spreadsheet_id", description="The ID of the spreadsheet.", type="string", required=True),
+            _SPREADSHEET_ID_INPUT,
             ToolInputSchema(name="range", description="The A1 notation of a range (e.g., 'Sheet1!A1:C2' or 'Sheet1'). Values are appended after the last row of the table found in this range.", type="string", required=True),
             ToolInputSchema(name="values", description="A list of rows to append. Each row is a list of cell values (e.g., [['data1', 'data2'], ['data3', 'data4']]).", type="array", items_type="array", required=True),
-            ToolInputSchema(name="value_input_option", description="How input data is interpreted. Options: 'RAW', 'USER_ENTERED'. Default: 'USER_ENTERED'.", type="string", required=False),
+            _VALUE_INPUT_OPTION_INPUT,
             ToolInputSchema(name="insert_data_option", description="How data is inserted. Options: 'OVERWRITE', 'INSERT_ROWS'. Default: Appends after table, may overwrite.", type="string", required=False)
         ],
         output=ToolOutputSchemaDefinition(
@@ -52,11 +172,10 @@ def get_google_sheets_append_tool_definition() -> ToolDefinition:
     )
 
 async def execute_google_sheets_append(inputs: Dict[str, Any]) -> Dict[str, Any]:
-    global google_sheets_service
-    if not google_sheets_service:
-        initialize_google_sheets_tool()
-        if not google_sheets_service:
-             return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    state = await _get_sheets_state()
+    if not state:
+        return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    creds, client = state
     try:
         append_request = AppendRequest(**inputs)
     except Exception as e:
@@ -64,38 +183,45 @@ async def execute_google_sheets_append(inputs: Dict[str, Any]) -> Dict[str, Any]
 
     body = {"values": append_request.values}
     try:
-        request_params = {
-            "spreadsheetId": append_request.spreadsheet_id,
-            "range": append_request.range,
-            "valueInputOption": append_request.value_input_option,
-            "body": body,
-        }
+        request_params = {"valueInputOption": append_request.value_input_option}
         if append_request.insert_data_option:
             request_params["insertDataOption"] = append_request.insert_data_option
-        
-        result = google_sheets_service.spreadsheets().values().append(**request_params).execute()
+
+        content, headers = _encode_json_body(body)
+        headers.update(await _auth_headers(creds))
+        response = await client.post(
+            _values_url(append_request.spreadsheet_id, append_request.range, ":append"),
+            params=request_params,
+            content=content,
+            headers=headers
+        )
+        response.raise_for_status()
+        # orjson parses the nested values arrays several times faster than
+        # the stdlib json decoder behind response.json()
+        result = orjson.loads(response.content)
         output_response = {
             "spreadsheet_id": result.get("spreadsheetId"),
             "table_range": result.get("updates", {}).get("updatedRange"),
             "updates": result.get("updates")
         }
         return {"status": "success", "output": output_response, "error": None}
-    except HttpError as error:
-        return {"status": "failure", "output": None, "error": f"API error (append): {error.resp.status} - {error._get_reason()}. Details: {error.content.decode() if error.content else 'N/A'}"}
+    except httpx.HTTPStatusError as error:
+        return {"status": "failure", "output": None, "error": _http_error_message("append", error)}
     except Exception as e:
         return {"status": "failure", "output": None, "error": f"Tool execution error (append): {str(e)}"}
 
 # --- Read Tool --- #
+@lru_cache(maxsize=1)
 def get_google_sheets_read_tool_definition() -> ToolDefinition:
     return ToolDefinition(
         tool_name="google_sheets_read",
         description="Reads values from a Google Sheet.",
         inputs=[
-            ToolInputSchema(name="spreadsheet_id", description="The ID of the spreadsheet.", type="string", required=True),
+            _SPREADSHEET_ID_INPUT,
             ToolInputSchema(name="range", description="The A1 notation of the range to read (e.g., 'Sheet1!A1:B5').", type="string", required=True),
-            ToolInputSchema(name="major_dimension", description="ROWS or COLUMNS for result. Default: ROWS.", type="string", required=False),
-            ToolInputSchema(name="value_render_option", description="How values are rendered (e.g., FORMATTED_VALUE). Default: FORMATTED_VALUE", type="string", required=False),
-            ToolInputSchema(name="date_time_render_option", description="How date/time is rendered (e.g., SERIAL_NUMBER). Default: SERIAL_NUMBER", type="string", required=False)
+            _MAJOR_DIMENSION_INPUT,
+            _VALUE_RENDER_OPTION_INPUT,
+            _DATE_TIME_RENDER_OPTION_INPUT
         ],
         output=ToolOutputSchemaDefinition(
             type="object",
@@ -110,21 +236,17 @@ def get_google_sheets_read_tool_definition() -> ToolDefinition:
     )
 
 async def execute_google_sheets_read(inputs: Dict[str, Any]) -> Dict[str, Any]:
-    global google_sheets_service
-    if not google_sheets_service:
-        initialize_google_sheets_tool()
-        if not google_sheets_service:
-            return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    state = await _get_sheets_state()
+    if not state:
+        return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    creds, client = state
     try:
         read_request = ReadRequest(**inputs)
     except Exception as e:
         return {"status": "failure", "output": None, "error": f"Invalid input for read: {str(e)}"}
 
     try:
-        request_params = {
-            "spreadsheetId": read_request.spreadsheet_id,
-            "range": read_request.range,
-        }
+        request_params = {}
         if read_request.major_dimension:
             request_params["majorDimension"] = read_request.major_dimension
         if read_request.value_render_option:
@@ -132,17 +254,26 @@ async def execute_google_sheets_read(inputs: Dict[str, Any]) -> Dict[str, Any]:
         if read_request.date_time_render_option:
             request_params["dateTimeRenderOption"] = read_request.date_time_render_option
 
-        result = google_sheets_service.spreadsheets().values().get(**request_params).execute()
+        response = await client.get(
+            _values_url(read_request.spreadsheet_id, read_request.range),
+            params=request_params,
+            headers=await _auth_headers(creds)
+        )
+        response.raise_for_status()
+        # orjson parses the nested values arrays several times faster than
+        # the stdlib json decoder behind response.json()
+        result = orjson.loads(response.content)
         output_values = result.get("values", [])
         
         if not output_values:
             return {"status": "failure", "error": "Empty spreadsheet data"}
 
+        # Flattened generator with a frozenset membership test: short-circuits
+        # on the first non-empty cell without allocating a list per cell
         has_meaningful_data = any(
-            any(cell not in [None, "", " "] for cell in row)
-            for row in output_values
+            cell not in _EMPTY_CELLS for row in output_values for cell in row
         )
-        
+
         if not has_meaningful_data:
             return {
                 "status": "failure",
@@ -160,21 +291,22 @@ async def execute_google_sheets_read(inputs: Dict[str, Any]) -> Dict[str, Any]:
             "values": output_values
         }
         return {"status": "success", "output": output_response, "error": None}
-    except HttpError as error:
-        return {"status": "failure", "output": None, "error": f"API error (read): {error.resp.status} - {error._get_reason()}. Details: {error.content.decode() if error.content else 'N/A'}"}
+    except httpx.HTTPStatusError as error:
+        return {"status": "failure", "output": None, "error": _http_error_message("read", error)}
     except Exception as e:
         return {"status": "failure", "output": None, "error": f"Tool execution error (read): {str(e)}"}
 
 # --- Update Tool --- #
+@lru_cache(maxsize=1)
 def get_google_sheets_update_tool_definition() -> ToolDefinition:
     return ToolDefinition(
         tool_name="google_sheets_update",
         description="Updates (writes) values to a specific range in a Google Sheet.",
         inputs=[
-            ToolInputSchema(name="spreadsheet_id", description="The ID of the spreadsheet.", type="string", required=True),
+            _SPREADSHEET_ID_INPUT,
             ToolInputSchema(name="range", description="The A1 notation of the range to write (e.g., 'Sheet1!A1:B2').", type="string", required=True),
             ToolInputSchema(name="values", description="A list of rows to write. Each row is a list of cell values (e.g., [['newA1', 'newB1'], ['newA2', 'newB2']]).", type="array", items_type="array", required=True),
-            ToolInputSchema(name="value_input_option", description="How input data is interpreted. Options: 'RAW', 'USER_ENTERED'. Default: 'USER_ENTERED'.", type="string", required=False)
+            _VALUE_INPUT_OPTION_INPUT
         ],
         output=ToolOutputSchemaDefinition(
             type="object",
@@ -190,11 +322,10 @@ def get_google_sheets_update_tool_definition() -> ToolDefinition:
     )
 
 async def execute_google_sheets_update(inputs: Dict[str, Any]) -> Dict[str, Any]:
-    global google_sheets_service
-    if not google_sheets_service:
-        initialize_google_sheets_tool()
-        if not google_sheets_service:
-            return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    state = await _get_sheets_state()
+    if not state:
+        return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    creds, client = state
     try:
         update_request = UpdateRequest(**inputs)
     except Exception as e:
@@ -202,13 +333,18 @@ async def execute_google_sheets_update(inputs: Dict[str, Any]) -> Dict[str, Any]
 
     body = {"values": update_request.values}
     try:
-        request_params = {
-            "spreadsheetId": update_request.spreadsheet_id,
-            "range": update_request.range,
-            "valueInputOption": update_request.value_input_option,
-            "body": body,
-        }
-        result = google_sheets_service.spreadsheets().values().update(**request_params).execute()
+        content, headers = _encode_json_body(body)
+        headers.update(await _auth_headers(creds))
+        response = await client.put(
+            _values_url(update_request.spreadsheet_id, update_request.range),
+            params={"valueInputOption": update_request.value_input_option},
+            content=content,
+            headers=headers
+        )
+        response.raise_for_status()
+        # orjson parses the nested values arrays several times faster than
+        # the stdlib json decoder behind response.json()
+        result = orjson.loads(response.content)
         output_response = {
             "spreadsheet_id": result.get("spreadsheetId"),
             "updated_range": result.get("updatedRange"),
@@ -217,7 +353,129 @@ async def execute_google_sheets_update(inputs: Dict[str, Any]) -> Dict[str, Any]
             "updated_cells": result.get("updatedCells")
         }
         return {"status": "success", "output": output_response, "error": None}
-    except HttpError as error:
-        return {"status": "failure", "output": None, "error": f"API error (update): {error.resp.status} - {error._get_reason()}. Details: {error.content.decode() if error.content else 'N/A'}"}
+    except httpx.HTTPStatusError as error:
+        return {"status": "failure", "output": None, "error": _http_error_message("update", error)}
     except Exception as e:
         return {"status": "failure", "output": None, "error": f"Tool execution error (update): {str(e)}"}
+
+# --- Batch Read Tool --- #
+@lru_cache(maxsize=1)
+def get_google_sheets_batch_read_tool_definition() -> ToolDefinition:
+    return ToolDefinition(
+        tool_name="google_sheets_batch_read",
+        description="Reads values from multiple ranges of a Google Sheet in a single API call.",
+        inputs=[
+            _SPREADSHEET_ID_INPUT,
+            ToolInputSchema(name="ranges", description="A list of A1 notation ranges to read (e.g., ['Sheet1!A1:B5', 'Sheet2!C1:C10']).", type="array", items_type="string", required=True),
+            _MAJOR_DIMENSION_INPUT,
+            _VALUE_RENDER_OPTION_INPUT,
+            _DATE_TIME_RENDER_OPTION_INPUT
+        ],
+        output=ToolOutputSchemaDefinition(
+            type="object",
+            description="The data read from all requested ranges.",
+            properties={
+                "spreadsheet_id": {"type": "string", "description": "ID of the spreadsheet."},
+                "value_ranges": {"type": "array", "description": "One ValueRange object (range, majorDimension, values) per requested range, in request order."}
+            }
+        )
+    )
+
+async def execute_google_sheets_batch_read(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    state = await _get_sheets_state()
+    if not state:
+        return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    creds, client = state
+    try:
+        batch_read_request = BatchReadRequest(**inputs)
+    except Exception as e:
+        return {"status": "failure", "output": None, "error": f"Invalid input for batch read: {str(e)}"}
+
+    try:
+        # One batchGet round-trip replaces len(ranges) values.get calls
+        request_params = [("ranges", range_) for range_ in batch_read_request.ranges]
+        if batch_read_request.major_dimension:
+            request_params.append(("majorDimension", batch_read_request.major_dimension))
+        if batch_read_request.value_render_option:
+            request_params.append(("valueRenderOption", batch_read_request.value_render_option))
+        if batch_read_request.date_time_render_option:
+            request_params.append(("dateTimeRenderOption", batch_read_request.date_time_render_option))
+
+        response = await client.get(
+            f"/{batch_read_request.spreadsheet_id}/values:batchGet",
+            params=request_params,
+            headers=await _auth_headers(creds)
+        )
+        response.raise_for_status()
+        # orjson parses the nested values arrays several times faster than
+        # the stdlib json decoder behind response.json()
+        result = orjson.loads(response.content)
+        output_response = {
+            "spreadsheet_id": result.get("spreadsheetId"),
+            "value_ranges": result.get("valueRanges", [])
+        }
+        return {"status": "success", "output": output_response, "error": None}
+    except httpx.HTTPStatusError as error:
+        return {"status": "failure", "output": None, "error": _http_error_message("batch read", error)}
+    except Exception as e:
+        return {"status": "failure", "output": None, "error": f"Tool execution error (batch read): {str(e)}"}
+
+# --- Batch Update Tool --- #
+@lru_cache(maxsize=1)
+def get_google_sheets_batch_update_tool_definition() -> ToolDefinition:
+    return ToolDefinition(
+        tool_name="google_sheets_batch_update",
+        description="Updates (writes) values to multiple ranges in a Google Sheet in a single API call.",
+        inputs=[
+            _SPREADSHEET_ID_INPUT,
+            ToolInputSchema(name="data", description="A list of {'range': ..., 'values': ...} objects to write (e.g., [{'range': 'Sheet1!A1:B2', 'values': [['a', 'b']]}]).", type="array", items_type="object", required=True),
+            _VALUE_INPUT_OPTION_INPUT
+        ],
+        output=ToolOutputSchemaDefinition(
+            type="object",
+            description="Result of the batch update operation.",
+            properties={
+                "spreadsheet_id": {"type": "string", "description": "ID of the spreadsheet."},
+                "total_updated_cells": {"type": "integer", "description": "Total cells updated across all ranges."},
+                "responses": {"type": "array", "description": "One UpdateValuesResponse per written range, in request order."}
+            }
+        )
+    )
+
+async def execute_google_sheets_batch_update(inputs: Dict[str, Any]) -> Dict[str, Any]:
+    state = await _get_sheets_state()
+    if not state:
+        return {"status": "failure", "output": None, "error": "Tool error: Google Sheets client not initialized."}
+    creds, client = state
+    try:
+        batch_update_request = BatchUpdateRequest(**inputs)
+    except Exception as e:
+        return {"status": "failure", "output": None, "error": f"Invalid input for batch update: {str(e)}"}
+
+    try:
+        # One batchUpdate round-trip replaces len(data) values.update calls
+        body = {
+            "valueInputOption": batch_update_request.value_input_option,
+            "data": [{"range": item.range, "values": item.values} for item in batch_update_request.data]
+        }
+        content, headers = _encode_json_body(body)
+        headers.update(await _auth_headers(creds))
+        response = await client.post(
+            f"/{batch_update_request.spreadsheet_id}/values:batchUpdate",
+            content=content,
+            headers=headers
+        )
+        response.raise_for_status()
+        # orjson parses the nested values arrays several times faster than
+        # the stdlib json decoder behind response.json()
+        result = orjson.loads(response.content)
+        output_response = {
+            "spreadsheet_id": result.get("spreadsheetId"),
+            "total_updated_cells": result.get("totalUpdatedCells"),
+            "responses": result.get("responses")
+        }
+        return {"status": "success", "output": output_response, "error": None}
+    except httpx.HTTPStatusError as error:
+        return {"status": "failure", "output": None, "error": _http_error_message("batch update", error)}
+    except Exception as e:
+        return {"status": "failure", "output": None, "error": f"Tool execution error (batch update): {str(e)}"}
@@ -1,39 +1,95 @@
+import asyncio
 import os
 import logging
-from typing import Optional, Dict, Any, List
-import asyncio
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 
-from tavily import TavilyClient
+import httpx
 from dotenv import load_dotenv
 
 # Assuming general MCP models are in toolkit.mcp_server.models
 # Adjust import path if necessary based on final structure
 from toolkit.mcp_server.models import ToolDefinition, ToolInputSchema, ToolOutputSchemaDefinition
 
-# Load environment variables from .env file (if used, ensure .env is in the correct path relative to execution)
-load_dotenv()
-
-TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+TAVILY_API_BASE_URL = "https://api.tavily.com"
+
+# Accepted search_depth values, hoisted so the executor does a frozenset
+# membership test instead of building a list per call
+_VALID_SEARCH_DEPTHS = frozenset(("basic", "advanced"))
+
+# Process-level LRU result cache: agent sessions frequently repeat the same
+# query within minutes, and every Tavily call costs network latency and API
+# quota. Entries expire after a TTL; pass no_cache=True to bypass.
+_SEARCH_CACHE_MAX_ENTRIES = 128
+_SEARCH_CACHE_TTL_SECONDS = 600.0
+_search_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_search_cache_lock = asyncio.Lock()
+
+async def _get_cached_search(cache_key: Tuple[str, str, int]) -> Optional[Dict[str, Any]]:
+    """Returns a fresh cached response for the key, dropping it if expired."""
+    async with _search_cache_lock:
+        cached = _search_cache.get(cache_key)
+        if cached is None:
+            return None
+        expires_at, payload = cached
+        if time.monotonic() >= expires_at:
+            del _search_cache[cache_key]
+            return None
+        _search_cache.move_to_end(cache_key)
+        return payload
+
+async def _store_cached_search(cache_key: Tuple[str, str, int], payload: Dict[str, Any]) -> None:
+    """Caches a search response, evicting the least recently used entries."""
+    async with _search_cache_lock:
+        _search_cache[cache_key] = (time.monotonic() + _SEARCH_CACHE_TTL_SECONDS, payload)
+        _search_cache.move_to_end(cache_key)
+        while len(_search_cache) > _SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
 
 logger = logging.getLogger(__name__)
 
-# Global Tavily client instance for this tool
-tavily_client: Optional[TavilyClient] = None
+# Global pooled async HTTP client for the Tavily REST API
+tavily_http: Optional[httpx.AsyncClient] = None
+tavily_api_key: Optional[str] = None
+
+# Tracks whether .env has been loaded; done lazily so importing this module
+# never pays dotenv's filesystem walk
+_dotenv_loaded = False
+
+def _load_api_key() -> Optional[str]:
+    """Loads .env (once) and reads TAVILY_API_KEY, as part of lazy init rather than import."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+    return os.getenv("TAVILY_API_KEY")
 
 def initialize_tavily_search_tool():
-    """Initializes the Tavily client for the search tool."""
-    global tavily_client
-    if tavily_client:
+    """Initializes the pooled async HTTP client for the search tool."""
+    global tavily_http, tavily_api_key
+    if tavily_http:
         logger.info("Tavily search tool client already initialized.")
         return
 
-    api_key = TAVILY_API_KEY # Use the module-level loaded key
+    api_key = _load_api_key()
     if api_key:
-        tavily_client = TavilyClient(api_key=api_key)
-        logger.info("Tavily client initialized successfully for tavily_search_tool.")
+        tavily_api_key = api_key
+        # Native async transport: searches run on the event loop with warm
+        # keep-alive connections instead of tying up a thread-pool worker
+        # per query via asyncio.to_thread.
+        tavily_http = httpx.AsyncClient(
+            base_url=TAVILY_API_BASE_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=20),
+            transport=httpx.AsyncHTTPTransport(retries=3)
+        )
+        logger.info("Tavily HTTP client initialized successfully for tavily_search_tool.")
     else:
         logger.warning("TAVILY_API_KEY not set. Tavily search tool will be non-functional.")
 
+@lru_cache(maxsize=1)
 def get_tavily_search_tool_definition() -> ToolDefinition:
     return ToolDefinition(
         tool_name="tavily_search",
@@ -41,6 +97,7 @@ def get_tavily_search_tool_definition() -> ToolDefinition:
         inputs=[
             ToolInputSchema(name="query", description="The search query string.", type="string", required=True, example="latest news on AI model advancements"),
             ToolInputSchema(name="max_results", description="The maximum number of search results to return. Default is 5 (Min:1, Max:20).", type="integer", required=False, example=3),
+            ToolInputSchema(name="no_cache", description="Set to true to bypass the short-lived result cache and always hit the Tavily API.", type="boolean", required=False, example=False),
             # Consider adding other Tavily parameters like search_depth if they should be exposed
         ],
         output=ToolOutputSchemaDefinition(
@@ -93,8 +150,7 @@ async def execute_tavily_search(inputs: Dict[str, Any]) -> Dict[str, Any]:
     Returns a dictionary structured for the MCP tool_execution_payload:
     { "status": "success" | "failure", "output": <tavily_response_dict> | None, "error": <error_message> | None }
     """
-    global tavily_client
-    if not tavily_client:
+    if not tavily_http:
         logger.error("Tavily client not initialized for execute_tavily_search.")
         return {"status": "failure", "output": None, "error": "Tool error: Tavily client not initialized."}
 
@@ -103,37 +159,52 @@ async def execute_tavily_search(inputs: Dict[str, Any]) -> Dict[str, Any]:
         return {"status": "failure", "output": None, "error": "Invalid input: 'query' is missing or not a string."}
 
     try:
-        logger.info(f"Executing tavily_search with query: '{query}'") # Corrected logging quote
-        search_depth = inputs.get("search_depth", "advanced") # Default to advanced as in original main.py
-        max_results = inputs.get("max_results", 5) # Default to 5 as in original
-
-        if not isinstance(search_depth, str) or search_depth not in ["basic", "advanced"]:
+        # %s-style args are only rendered if a handler accepts the record
+        logger.info("Executing tavily_search with query: '%s'", query)
+        search_depth = inputs.get("search_depth") # Default to advanced as in original main.py
+        if not isinstance(search_depth, str) or search_depth not in _VALID_SEARCH_DEPTHS:
             search_depth = "advanced"
-        if not isinstance(max_results, int) or not (0 < max_results <= 20):
+        max_results = inputs.get("max_results", 5) # Default to 5 as in original
+        if not isinstance(max_results, int) or not (1 <= max_results <= 20):
             max_results = 5
 
-        # Run the blocking Tavily SDK call in a separate thread
-        raw_tavily_search_output = await asyncio.to_thread(
-            tavily_client.search, # The blocking function
-            query=query,          # Arguments to the function
-            search_depth=search_depth,
-            max_results=max_results
-            # include_answer=False, # Can be a configurable input if added to schema
+        cache_key = (query, search_depth, max_results)
+        use_cache = not inputs.get("no_cache", False)
+        if use_cache:
+            cached_output = await _get_cached_search(cache_key)
+            if cached_output is not None:
+                logger.info("Returning cached tavily_search result for query: '%s'", query)
+                return {"status": "success", "output": cached_output, "error": None}
+
+        response = await tavily_http.post(
+            "/search",
+            json={
+                "api_key": tavily_api_key,
+                "query": query,
+                "search_depth": search_depth,
+                "max_results": max_results
+                # "include_answer": False, # Can be a configurable input if added to schema
+            }
         )
-        
+        response.raise_for_status()
+        raw_tavily_search_output = response.json()
+
+        if use_cache:
+            await _store_cached_search(cache_key, raw_tavily_search_output)
+
         # The output schema defined earlier should match the structure of raw_tavily_search_output.
         # Tavily client itself returns a dict. We assume this dict is the desired output.
         return {"status": "success", "output": raw_tavily_search_output, "error": None}
 
     except Exception as e:
-        logger.error(f"Error during Tavily search execution: {e}", exc_info=True)
+        logger.error("Error during Tavily search execution: %s", e, exc_info=True)
         return {"status": "failure", "output": None, "error": f"Tool execution error: {str(e)}"}
 
 # Example of how to initialize (e.g., called from server startup)
 # if __name__ == '__main__':
 #     logging.basicConfig(level=logging.INFO)
 #     initialize_tavily_search_tool()
-#     if tavily_client:
+#     if tavily_http:
 #         print("Tavily client initialized for standalone test.")
 #         # Example execution (requires asyncio for async def)
 #         async def test_run():
@@ -1,30 +1,77 @@
+import asyncio
 import logging
+import logging.handlers
 import os
+import queue
+import sys
 from contextlib import asynccontextmanager
-from typing import Dict, Any # Minimal imports needed at the top
+from typing import Dict, Any, Callable, Awaitable # Minimal imports needed at the top
 
-from fastapi import FastAPI, HTTPException # Keep FastAPI
-from dotenv import load_dotenv
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response # Keep FastAPI
+from fastapi.responses import ORJSONResponse
 
 # MCP Server specific models and registry
-from .models import JsonRpcRequest, JsonRpcResponse, ServerSchemaResponse # Relative imports
+from .models import JsonRpcResponse, ServerSchemaResponse # Relative imports
 from .tool_registry import (
     discover_and_register_tools,
-    get_all_tool_definitions,
+    get_all_tool_definitions_cached,
+    get_all_tool_definitions_json,
     call_tool
 )
 
-# Load environment variables from .env file (if your tools need them directly at init)
-# Individual tools (like Tavily) are expected to load their own keys if they manage them
-load_dotenv() 
-
-# Setup logging
-logging.basicConfig(level=logging.INFO)
+# Setup logging. Level comes from the environment (WARNING by default in
+# production); the hot path only enqueues records — the formatting and the
+# write() syscall happen on the QueueListener's thread, off the event loop.
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "WARNING").upper(),
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler()
+)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
+# Error payload templates, pre-serialized at import: the error paths splice
+# the request id into a byte-level envelope and never touch pydantic
+def _error_response(error_bytes: bytes, rpc_id: Any) -> Response:
+    return Response(
+        content=b'{"jsonrpc":"2.0","result":null,"error":' + error_bytes
+                + b',"id":' + orjson.dumps(rpc_id) + b'}',
+        media_type="application/json"
+    )
+
+_ERR_PARSE = b'{"code":-32700,"message":"Parse error: request body is not valid JSON."}'
+_ERR_NOT_OBJECT = b'{"code":-32600,"message":"Invalid Request: request must be an object."}'
+_ERR_EMPTY_BATCH = b'{"code":-32600,"message":"Invalid Request: batch must not be empty."}'
+_ERR_METHOD_NOT_STRING = b'{"code":-32600,"message":"Invalid Request: \'method\' must be a string."}'
+_ERR_PARAMS_NOT_OBJECT = b'{"code":-32602,"message":"Invalid params: \'params\' must be an object for mcp_call_tool."}'
+_ERR_TOOL_ID_MISSING = b'{"code":-32602,"message":"Invalid params: \'tool_id\' is missing or not a string."}'
+_ERR_INPUTS_MISSING = b'{"code":-32602,"message":"Invalid params: \'inputs\' is missing or not an object."}'
+
+# Interned method and param-key strings: dict lookups against keys parsed
+# from JSON short-circuit on pointer equality instead of comparing chars
+_M_LIST_TOOLS = sys.intern("mcp_list_tools")
+_M_CALL_TOOL = sys.intern("mcp_call_tool")
+_K_METHOD = sys.intern("method")
+_K_PARAMS = sys.intern("params")
+_K_ID = sys.intern("id")
+_K_TOOL_ID = sys.intern("tool_id")
+_K_INPUTS = sys.intern("inputs")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("MCP Server: Lifespan event - startup")
+    # dotenv is imported here rather than at module top so worker fork /
+    # cold-start never pays for it before the app is actually starting.
+    # load_dotenv itself walks up from this module's directory to find .env,
+    # so deployments keeping .env beside the package keep working. Individual
+    # tools (like Tavily) still load their own keys if they manage them.
+    from dotenv import load_dotenv
+    load_dotenv()
     # Discover and initialize tools from the specified directory
     # The actual path to tools needs to be correct from the execution context.
     # If main.py is in toolkit/mcp_server, and tools are in toolkit/available_tools,
@@ -34,6 +81,7 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("MCP Server: Lifespan event - shutdown")
     # Add any global cleanup logic here if needed
+    _log_listener.stop() # Flush queued records before the process exits
 
 app = FastAPI(
     title="Unified MCP Tool Server",
@@ -42,62 +90,107 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-@app.post("/mcp", response_model=JsonRpcResponse, summary="MCP JSON-RPC Endpoint")
-async def mcp_rpc_handler(request: JsonRpcRequest):
-    logger.info(f"MCP Endpoint: Received JSON-RPC request with method: {request.method}, id: {request.id}")
+async def _handle_list_tools(params: Any, rpc_id: Any) -> Response:
+    # Definitions are frozen at startup; splice the pre-serialized array
+    # into the envelope so this branch does no per-request serialization
+    # beyond the request id.
+    return Response(
+        content=b'{"jsonrpc":"2.0","result":' + get_all_tool_definitions_json()
+                + b',"error":null,"id":' + orjson.dumps(rpc_id) + b'}',
+        media_type="application/json"
+    )
 
-    if request.method == "mcp_list_tools":
-        tools_definitions = get_all_tool_definitions()
-        # Pydantic models will be serialized to dicts by FastAPI/Pydantic
-        return JsonRpcResponse(result=[td.model_dump() for td in tools_definitions], id=request.id)
-    
-    elif request.method == "mcp_call_tool":
-        if not request.params or not isinstance(request.params, dict):
-             return JsonRpcResponse(
-                error={"code": -32602, "message": "Invalid params: 'params' must be an object for mcp_call_tool."},
-                id=request.id
-            )
-
-        tool_name = request.params.get("tool_id") # MCP spec uses tool_id, but our registry uses tool_name
-        inputs = request.params.get("inputs")
-
-        if not tool_name or not isinstance(tool_name, str):
-            return JsonRpcResponse(
-                error={"code": -32602, "message": "Invalid params: 'tool_id' is missing or not a string."},
-                id=request.id
-            )
-        if inputs is None or not isinstance(inputs, dict): # inputs can be an empty dict
-            return JsonRpcResponse(
-                error={"code": -32602, "message": "Invalid params: 'inputs' is missing or not an object."},
-                id=request.id
-            )
+async def _handle_call_tool(params: Any, rpc_id: Any) -> Response:
+    if not params or not isinstance(params, dict):
+        return _error_response(_ERR_PARAMS_NOT_OBJECT, rpc_id)
+
+    tool_name = params.get(_K_TOOL_ID) # MCP spec uses tool_id, but our registry uses tool_name
+    inputs = params.get(_K_INPUTS)
 
+    if not tool_name or not isinstance(tool_name, str):
+        return _error_response(_ERR_TOOL_ID_MISSING, rpc_id)
+    if inputs is None or not isinstance(inputs, dict): # inputs can be an empty dict
+        return _error_response(_ERR_INPUTS_MISSING, rpc_id)
+
+    try:
         tool_execution_payload = await call_tool(tool_name, inputs)
+    except KeyError:
+        logger.warning("Attempted to call unknown tool: '%s'", tool_name)
+        return _error_response(
+            orjson.dumps({"code": -32601, "message": f"Method not found or error: Tool with id '{tool_name}' is not available."}),
+            rpc_id
+        )
+
+    # The payload is returned verbatim — executor failures come back as
+    # structured {"status": "failure", ...} results, and falsy-but-valid
+    # payloads are not mistaken for a missing tool
+    return ORJSONResponse({
+        "jsonrpc": "2.0",
+        "result": tool_execution_payload,
+        "error": None,
+        "id": rpc_id
+    })
+
+# Method dispatch table: one dict lookup per request instead of an if/elif
+# chain, and each handler call site stays monomorphic
+_METHODS: Dict[str, Callable[[Any, Any], Awaitable[Response]]] = {
+    _M_LIST_TOOLS: _handle_list_tools,
+    _M_CALL_TOOL: _handle_call_tool,
+}
+
+async def _dispatch_request(payload: Any):
+    if not isinstance(payload, dict):
+        return _error_response(_ERR_NOT_OBJECT, None)
 
-        if tool_execution_payload: # call_tool returns the payload directly
-            return JsonRpcResponse(result=tool_execution_payload, id=request.id)
-        else:
-            # call_tool logs errors, but we need a specific JSON-RPC error here
-            return JsonRpcResponse(
-                error={"code": -32601, "message": f"Method not found or error: Tool with id '{tool_name}' is not available or failed execution."},
-                id=request.id
-            )
-    else:
-        logger.warning(f"MCP Endpoint: Method '{request.method}' not found.")
-        return JsonRpcResponse(
-            error={"code": -32601, "message": f"Method '{request.method}' not found."},
-            id=request.id
+    method = payload.get(_K_METHOD)
+    rpc_id = payload.get(_K_ID)
+    # A non-string (possibly unhashable) method must be rejected before the
+    # dispatch-table lookup, not surface as a TypeError/HTTP 500
+    if not isinstance(method, str):
+        return _error_response(_ERR_METHOD_NOT_STRING, rpc_id)
+    logger.info("MCP Endpoint: Received JSON-RPC request with method: %s, id: %s", method, rpc_id)
+
+    handler = _METHODS.get(method)
+    if handler is None:
+        logger.warning("MCP Endpoint: Method '%s' not found.", method)
+        return _error_response(orjson.dumps({"code": -32601, "message": f"Method '{method}' not found."}), rpc_id)
+    return await handler(payload.get(_K_PARAMS), rpc_id)
+
+# response_model is deliberately omitted on these routes: handlers return
+# Response/ORJSONResponse objects serialized exactly once, so FastAPI's
+# output revalidation + jsonable_encoder pass never runs. The responses=
+# mapping keeps the schemas in the OpenAPI docs without runtime enforcement.
+@app.post("/mcp", summary="MCP JSON-RPC Endpoint", responses={200: {"model": JsonRpcResponse}})
+async def mcp_rpc_handler(request: Request):
+    # Parse the raw body with orjson instead of FastAPI's stdlib-json +
+    # pydantic ingress: the envelope is tiny and the handlers do their own
+    # shape checks, so full model validation buys nothing here.
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        return _error_response(_ERR_PARSE, None)
+
+    if isinstance(payload, list):
+        # JSON-RPC 2.0 batch: fan the calls out on the event loop. Tool
+        # executors are I/O-bound, so total latency is roughly the slowest
+        # call rather than the sum; tool_registry caps the fan-out.
+        if not payload:
+            return _error_response(_ERR_EMPTY_BATCH, None)
+        responses = await asyncio.gather(*(_dispatch_request(p) for p in payload))
+        return Response(
+            content=b"[" + b",".join(r.body for r in responses) + b"]",
+            media_type="application/json"
         )
+    return await _dispatch_request(payload)
 
-@app.get("/schema", response_model=ServerSchemaResponse, summary="Get Server and Tools Schema")
+@app.get("/schema", summary="Get Server and Tools Schema", responses={200: {"model": ServerSchemaResponse}})
 async def get_server_schema():
-    tools_definitions = get_all_tool_definitions()
-    return ServerSchemaResponse(
-        name="Unified MCP Tool Server",
-        description="Provides access to various tools via the MCP JSON-RPC interface. This schema describes the server and its available tools.",
-        version=app.version,
-        tools=tools_definitions # Already a list of ToolDefinition models
-    )
+    return ORJSONResponse({
+        "name": "Unified MCP Tool Server",
+        "description": "Provides access to various tools via the MCP JSON-RPC interface. This schema describes the server and its available tools.",
+        "version": app.version,
+        "tools": get_all_tool_definitions_cached()
+    })
 
 if __name__ == "__main__":
     import uvicorn
@@ -108,9 +201,13 @@ if __name__ == "__main__":
     #     logger.warning("TAVILY_API_KEY is not set. Some tools like Tavily search may not function.")
 
     uvicorn.run(
-        "toolkit.mcp_server.main:app", 
-        host="0.0.0.0", 
-        port=8001, 
-        reload=True, # Reload for development
-        # reload_dirs=["toolkit"], # If you want to specify dirs for reload explicitly
-    ) 
\ No newline at end of file
+        "toolkit.mcp_server.main:app",
+        host="0.0.0.0",
+        port=8001,
+        reload=bool(int(os.getenv("DEV_RELOAD", "0"))), # Set DEV_RELOAD=1 for auto-reload during development
+        # uvloop + httptools ship with uvicorn[standard]; explicit so Linux
+        # never falls back to the pure-Python selector loop / stdlib parser
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+    )
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any, Union
+from typing import List, Literal, Optional, Dict, Any, Union
 from pydantic import BaseModel, Field
 
 # --- Pydantic Models for MCP Schema ---
@@ -31,13 +31,15 @@ class ServerSchemaResponse(BaseModel):
 
 # --- MCP JSON-RPC Models ---
 class JsonRpcRequest(BaseModel):
-    jsonrpc: str = Field("2.0", Literal=True)
+    # Field("2.0", Literal=True) was silently ignored by pydantic v2; a real
+    # Literal type enforces the spec value and validates as an identity check
+    jsonrpc: Literal["2.0"] = "2.0"
     method: str
     params: Optional[Union[Dict[str, Any], List[Any]]] = None
     id: Optional[Union[str, int]] = None
 
 class JsonRpcResponse(BaseModel):
-    jsonrpc: str = Field("2.0", Literal=True)
+    jsonrpc: Literal["2.0"] = "2.0"
     result: Optional[Any] = None
     error: Optional[Dict[str, Any]] = None # Based on JSON-RPC spec for error object
     id: Union[str, int, None]
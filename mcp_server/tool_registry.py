@@ -1,67 +1,78 @@
-import importlib
-import inspect
+import asyncio
 import logging
-import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Callable, Awaitable
+from typing import Any, Dict, List, NamedTuple, Optional, Callable, Awaitable, Tuple
 
 # Assuming general MCP models are in toolkit.mcp_server.models
 from toolkit.mcp_server.models import ToolDefinition
 # Import directly from the available_tools package
 from toolkit.available_tools import (
-    TOOL_DEFINITIONS as AVAILABLE_TOOL_DEFINITIONS,
-    TOOL_EXECUTORS as AVAILABLE_TOOL_EXECUTORS,
-    initialize_all_tools as initialize_all_available_tools,
-    get_all_tool_definitions as get_all_available_tool_definitions # If needed for direct passthrough
+    get_tool_executor as get_available_tool_executor,
+    get_all_tool_initializers as get_all_available_tool_initializers,
+    get_all_tool_definitions as get_all_available_tool_definitions
 )
 
 logger = logging.getLogger(__name__)
 
-# Structure to hold loaded tool information
-class RegisteredTool:
+# Structure to hold loaded tool information. A NamedTuple rather than a
+# plain class: no per-instance __dict__, and field access is a tuple index
+# instead of an attribute lookup through the MRO.
+class RegisteredTool(NamedTuple):
     name: str
     definition: ToolDefinition
     # initialize_func is handled by initialize_all_available_tools now
     execute_func: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
-
-    def __init__(
-        self,
-        name: str,
-        definition: ToolDefinition,
-        execute_func: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
-        # initialize_func: Optional[Callable[[], None]] = None, # Removed
-    ):
-        self.name = name
-        self.definition = definition
-        # self.initialize_func = initialize_func # Removed
-        self.execute_func = execute_func
+    # Serialized form of `definition`, computed once at registration so
+    # consumers never re-run pydantic's model_dump traversal
+    definition_dump: Dict[str, Any]
 
 _tool_registry: Dict[str, RegisteredTool] = {}
 
-# Standardized function names expected in each tool module
-GET_DEFINITION_FUNC_NAME = "get_tool_definition"  # e.g., get_tavily_search_tool_definition
-EXECUTE_FUNC_NAME = "execute_tool"            # e.g., execute_tavily_search
-INITIALIZE_FUNC_NAME = "initialize_tool"      # e.g., initialize_tavily_search_tool
+# Serialized views of the registry, rebuilt at the end of
+# discover_and_register_tools. Definitions never change after startup, so the
+# list-tools / schema paths can serve these instead of re-running
+# model_dump on every request.
+_tool_definitions_tuple: Tuple[ToolDefinition, ...] = ()
+_tool_definitions_cached: List[Dict[str, Any]] = []
+_tool_definitions_json: bytes = b"[]"
+
+# Caps concurrent tool executions so a large JSON-RPC batch cannot exhaust
+# downstream connection pools or API quotas
+_MAX_CONCURRENT_TOOL_CALLS = 16
+_tool_call_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_TOOL_CALLS)
 
 async def discover_and_register_tools(): # Removed tools_base_path argument
     """
     Registers tools by using the centralized registration from toolkit.available_tools.
     Initializes all discovered tools.
     """
-    global _tool_registry
+    global _tool_registry, _tool_definitions_tuple, _tool_definitions_cached, _tool_definitions_json
     _tool_registry = {} # Reset registry
 
     logger.info("Starting tool registration using toolkit.available_tools...")
 
     try:
-        # Initialize all tools (this will call their individual initializers)
-        # This should be called ideally once at application startup.
-        # If discover_and_register_tools can be called multiple times, ensure initialize_all_available_tools handles that gracefully (idempotent)
-        initialize_all_available_tools() 
-        logger.info("Successfully called initialize_all_available_tools.")
-
-        for tool_name, definition in AVAILABLE_TOOL_DEFINITIONS.items():
-            executor = AVAILABLE_TOOL_EXECUTORS.get(tool_name)
+        # Run all tool initializers concurrently off the event loop: they are
+        # sync and I/O-bound (credential lookups, client construction), so
+        # startup cost is roughly the slowest one rather than the sum. A
+        # failed initializer is logged and does not block the others — its
+        # tool reports the missing client at execution time, as before.
+        initializers = get_all_available_tool_initializers()
+        if initializers:
+            results = await asyncio.gather(
+                *(asyncio.to_thread(initializer) for initializer in initializers),
+                return_exceptions=True
+            )
+            for initializer, result in zip(initializers, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Tool initializer '{initializer.__name__}' failed: {result}", exc_info=result)
+        logger.info("Tool initializers completed.")
+
+        for definition in get_all_available_tool_definitions():
+            tool_name = definition.tool_name
+            # Resolved per tool rather than through a snapshot of
+            # TOOL_EXECUTORS, so tools registered after this module was
+            # imported are still picked up
+            executor = get_available_tool_executor(tool_name)
             if executor:
                 if tool_name in _tool_registry:
                     logger.warning(f"Duplicate tool name '{tool_name}' encountered during registration. Overwriting.")
@@ -69,40 +80,66 @@ async def discover_and_register_tools(): # Removed tools_base_path argument
                 _tool_registry[tool_name] = RegisteredTool(
                     name=tool_name,
                     definition=definition,
-                    execute_func=executor
+                    execute_func=executor,
+                    definition_dump=definition.model_dump(mode="json")
                 )
                 logger.info(f"Registered tool: '{tool_name}'")
             else:
                 logger.warning(f"Executor not found for tool '{tool_name}' in AVAILABLE_TOOL_EXECUTORS. Skipping registration.")
         
-        logger.info(f"Tool registration complete. {_tool_registry.keys().__len__()} tools registered: {list(_tool_registry.keys())}")
+        # Freeze the serialized forms once; hot paths return these directly
+        _tool_definitions_tuple = tuple(tool.definition for tool in _tool_registry.values())
+        _tool_definitions_cached = [tool.definition_dump for tool in _tool_registry.values()]
+        # model_dump_json serializes model -> JSON in one Rust pass, instead
+        # of dumping to dicts and re-traversing them with an external encoder
+        _tool_definitions_json = b"[" + b",".join(
+            tool.definition.model_dump_json().encode() for tool in _tool_registry.values()
+        ) + b"]"
+
+        logger.info(f"Tool registration complete. {len(_tool_registry)} tools registered: {list(_tool_registry)}")
 
     except Exception as e:
         logger.error(f"Failed during tool registration from toolkit.available_tools: {e}", exc_info=True)
         # Depending on desired behavior, might re-raise or handle to allow server to start with no/few tools
 
-def get_all_tool_definitions() -> List[ToolDefinition]:
-    """Returns definitions of all successfully registered tools."""
-    return [tool.definition for tool in _tool_registry.values()]
+def get_all_tool_definitions() -> Tuple[ToolDefinition, ...]:
+    """Returns definitions of all successfully registered tools as a frozen tuple."""
+    return _tool_definitions_tuple
+
+def get_all_tool_definitions_cached() -> List[Dict[str, Any]]:
+    """Returns the dict form of all registered tool definitions, serialized once at startup."""
+    return _tool_definitions_cached
+
+def get_all_tool_definitions_json() -> bytes:
+    """Returns the registered tool definitions as a pre-serialized JSON array."""
+    return _tool_definitions_json
 
 async def call_tool(tool_name: str, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    tool = _tool_registry.get(tool_name)
-    if tool and callable(tool.execute_func):
-        logger.info(f"Calling tool: '{tool_name}' with inputs: {inputs}")
-        try:
+    """Executes a registered tool and returns its payload verbatim.
+
+    Raises KeyError for unknown tool names so callers can distinguish
+    "tool missing" from a falsy-but-valid executor result. Executor
+    exceptions are caught and surfaced as a failure payload.
+    """
+    tool = _tool_registry[tool_name] # Registry only holds callables; KeyError means unknown tool
+    # %s args render only if a handler accepts the record; inputs can be
+    # large, so their repr is built solely at DEBUG
+    logger.info("Calling tool: '%s'", tool_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool '%s' inputs: %r", tool_name, inputs)
+    try:
+        async with _tool_call_semaphore:
             return await tool.execute_func(inputs)
-        except Exception as e:
-            logger.error(f"Error executing tool '{tool_name}': {e}", exc_info=True)
-            return {"status": "failure", "output": None, "error": f"Internal error during '{tool_name}' execution: {str(e)}"}
-    
-    logger.warning(f"Attempted to call unknown or non-executable tool: '{tool_name}'")
-    # Consider returning a more specific error structure that conforms to tool execution payloads
-    return {"status": "failure", "output": None, "error": f"Tool '{tool_name}' not found or not executable."}
+    except Exception as e:
+        logger.error("Error executing tool '%s': %s", tool_name, e, exc_info=True)
+        return {"status": "failure", "output": None, "error": f"Internal error during '{tool_name}' execution: {str(e)}"}
 
 # Ensure __all__ is appropriate if this module is imported elsewhere with 'from ... import *'
 __all__ = [
     "discover_and_register_tools",
     "get_all_tool_definitions",
+    "get_all_tool_definitions_cached",
+    "get_all_tool_definitions_json",
     "call_tool",
     "RegisteredTool" # If this class needs to be accessed from outside
 ]